@@ -17,22 +17,23 @@ Default units:
 """
 
 import math
-import os
 import sys
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from operator import attrgetter
+from typing import NamedTuple
 
-# Import of annex functions (conversion, energy, etc.)
-CURRENT_DIR = os.path.dirname(__file__)
-ANNEX_DIR = os.path.join(CURRENT_DIR, "Annex Functions")
-if ANNEX_DIR not in sys.path:
-    sys.path.append(ANNEX_DIR)
+import numpy as np
 
-from Simple_Conversion_Functions import UO2_to_U
-from Annex_Cost_Functions import (
+# Import of annex functions (conversion, energy, etc.)
+from annex_functions.simple_conversion_functions import UO2_to_U
+from annex_functions._core import discounted_schedule_core
+from annex_functions.annex_cost_functions import (
     annual_energy_MWh,
     annual_fresh_fuel_mass_kg,
     annual_enriched_U_mass_kg,
     optimize_front_end_uranium_cost,
+    optimize_front_end_uranium_cost_batch,
 )
 
 
@@ -40,7 +41,27 @@ from Annex_Cost_Functions import (
 # 1. INPUT PARAMETERS (EDIT ONLY HERE)
 # ============================================================
 
-@dataclass
+def _hash_fields(params) -> int:
+    """
+    Hash of the compared fields of a parameters dataclass (consistent with its __eq__).
+
+    The parameters are the keys of the memoized model functions: hashing them
+    once at creation avoids rehashing every field on each cache lookup.
+    """
+    return hash(tuple(getattr(params, f.name) for f in fields(params) if f.compare))
+
+
+def _reduce_fields(params) -> tuple:
+    """
+    Pickle a parameters dataclass through its __init__ arguments.
+
+    String hashes change between processes, so the cached hash (and the
+    derived fields) must be recomputed on unpickling rather than restored.
+    """
+    return type(params), tuple(getattr(params, f.name) for f in fields(params) if f.init)
+
+
+@dataclass(frozen=True, slots=True)
 class ProjectParameters:
     # --- Project / reactor parameters ---
     country: str = "Serbie"
@@ -54,8 +75,8 @@ class ProjectParameters:
 
     # --- Natural uranium parameters ---
     distance_uranium_mine_to_enriching_factory_km: float = 5000.0
-    distance_enriching_factory_to_fuel_factory_km: float = 63
-    distance_fuel_factory_to_power_plant_km: float = 1600
+    distance_enriching_factory_to_fuel_factory_km: float = 63.0
+    distance_fuel_factory_to_power_plant_km: float = 1600.0
 
     # --- Enrichment parameters ---
     x_U_nat: float = 0.00711   # U-235 fraction in natural uranium
@@ -63,7 +84,7 @@ class ProjectParameters:
 
     # --- Core and fuel parameters ---
     assemblies_per_core: int = 163              # number of fuel assemblies in core (typical VVER-1200)
-    fuel_mass_per_assembly_kg: float = 534      # kgUO2 per assembly (oxide mass)
+    fuel_mass_per_assembly_kg: float = 534.0    # kgUO2 per assembly (oxide mass)
 
     # --- Derived parameters (computed automatically) ---
     # Uranium metal mass in one assembly (depends on fuel_mass_per_assembly_kg)
@@ -80,13 +101,24 @@ class ProjectParameters:
     distance_U_enriched_transport_km: float = 100.0  # enrichment plant to fuel fabrication plant
     distance_fresh_fuel_transport_km: float = 1000.0  # fuel fabrication plant to reactor site
     distance_spent_fuel_transport_km: float = 500.0   # reactor site to disposal/reprocessing facility
+
+    # Hash of the parameters, computed once since the instance is immutable
+    _hash: int = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         # Convert UO2 mass per assembly to uranium metal mass
-        self.U_mass_per_assembly_kg = UO2_to_U(self.fuel_mass_per_assembly_kg)
+        # (the dataclass is frozen so that it can be used as a cache key)
+        object.__setattr__(self, "U_mass_per_assembly_kg", UO2_to_U(self.fuel_mass_per_assembly_kg))
+        object.__setattr__(self, "_hash", _hash_fields(self))
 
+    def __hash__(self):
+        return self._hash
 
-@dataclass
+    def __reduce__(self):
+        return _reduce_fields(self)
+
+
+@dataclass(frozen=True, slots=True)
 class CostParameters:
     real_discount_rate: float = 0.05  # 5% real, discount rate net of inflation
     # --- CAPEX ---
@@ -120,6 +152,18 @@ class CostParameters:
     direct_disposal_per_kgSpentFuel_USD: float = 1300.0
     transport_spent_fuel_per_kg_per_km_USD: float = 6.0e-3  # $/kg spent fuel/km
 
+    # Hash of the parameters, computed once since the instance is immutable
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_hash", _hash_fields(self))
+
+    def __hash__(self):
+        return self._hash
+
+    def __reduce__(self):
+        return _reduce_fields(self)
+
 
 # ============================================================
 # 3. CAPEX
@@ -144,10 +188,45 @@ def compute_opex_total_USD_per_year(project: ProjectParameters, costs: CostParam
 # 5. FUEL CYCLE
 # ============================================================
 
+@dataclass(frozen=True, slots=True)
+class FuelBreakdown:
+    """
+    Cost of each step of the fuel cycle, in $/year (annual breakdown) or in $
+    (discounted breakdown).
 
-def fuel_cycle_cost_USD_per_year(project: ProjectParameters, costs: CostParameters) -> float:
+    Read-only, with a dict-like items() / values() in fuel cycle order.
     """
-    Annual fuel cycle cost ($/year):
+    U_nat: float  # natural uranium
+    transport_U_nat: float  # natural uranium transport (mine to conversion)
+    conversion: float
+    transport_U_converted: float  # converted uranium transport (conversion to enrichment)
+    SWU: float  # enrichment
+    transport_U_enriched: float  # enriched uranium transport (enrichment to fabrication)
+    fabrication: float
+    transport_fresh_fuel: float  # fresh fuel transport (fabrication to reactor)
+    back_end: float  # back-end disposal
+    transport_spent_fuel: float  # spent fuel transport (reactor to disposal)
+
+    def values(self):
+        """Step costs, in fuel cycle order."""
+        return (getattr(self, name) for name in _FUEL_STEPS)
+
+    def items(self):
+        """(step name, cost) pairs, in fuel cycle order."""
+        return ((name, getattr(self, name)) for name in _FUEL_STEPS)
+
+    def total(self) -> float:
+        """Sum of the step costs."""
+        return math.fsum(self.values())
+
+
+_FUEL_STEPS = tuple(f.name for f in fields(FuelBreakdown))
+
+
+@lru_cache(maxsize=32)
+def fuel_cycle(project: ProjectParameters, costs: CostParameters) -> tuple:
+    """
+    Annual fuel cycle cost ($/year) and its breakdown, computed in a single pass:
     - Natural uranium
     - Natural uranium transport (mine to conversion)
     - Conversion
@@ -158,6 +237,9 @@ def fuel_cycle_cost_USD_per_year(project: ProjectParameters, costs: CostParamete
     - Fresh fuel transport (fabrication to reactor)
     - Back-end of the cycle (spent fuel)
     - Spent fuel transport (reactor to disposal)
+
+    Returns (total, breakdown) where breakdown is a FuelBreakdown.
+    Results are memoized on (project, costs).
     """
     # Product mass (enriched uranium) per year
     product_mass_kg = annual_enriched_U_mass_kg(project)
@@ -176,12 +258,6 @@ def fuel_cycle_cost_USD_per_year(project: ProjectParameters, costs: CostParamete
         distance_U_converted_transport_km=project.distance_U_converted_transport_km,
     )
 
-    cost_U_nat = front_end["cost_U_nat_USD"]
-    cost_transport_nat = front_end["cost_transport_U_nat_USD"]
-    cost_conversion = front_end["cost_conversion_USD"]
-    cost_transport_converted = front_end["cost_transport_U_converted_USD"]
-    cost_swu = front_end["cost_enrichment_USD"]
-    
     # Enriched uranium transport (enrichment to fabrication)
     cost_transport_enriched = (
         product_mass_kg
@@ -200,8 +276,8 @@ def fuel_cycle_cost_USD_per_year(project: ProjectParameters, costs: CostParamete
 
     # Back-end cycle (assume discharged mass ≈ fresh fuel mass)
     kg_spent_fuel = fresh_fuel_mass_UO2_kg
-    cost_backend = kg_spent_fuel * costs.direct_disposal_per_kgSpentFuel_USD
-    
+    cost_back_end = kg_spent_fuel * costs.direct_disposal_per_kgSpentFuel_USD
+
     # Spent fuel transport (reactor to disposal)
     cost_transport_spent_fuel = (
         kg_spent_fuel
@@ -209,137 +285,177 @@ def fuel_cycle_cost_USD_per_year(project: ProjectParameters, costs: CostParamete
         * project.distance_spent_fuel_transport_km
     )
 
-    total_fuel_cycle_USD = (
-        cost_U_nat
-        + cost_transport_nat
-        + cost_conversion
-        + cost_transport_converted
-        + cost_swu
-        + cost_transport_enriched
-        + cost_fabrication
-        + cost_transport_fresh_fuel
-        + cost_backend
-        + cost_transport_spent_fuel
-    )
-
-    return total_fuel_cycle_USD
-
-
-def detailed_fuel_cycle_breakdown_USD_per_year(project: ProjectParameters, costs: CostParameters) -> dict:
-    """Same as fuel_cycle_cost_USD_per_year but with a detailed breakdown ($/year)."""
-    product_mass_kg = annual_enriched_U_mass_kg(project)
-    front_end = optimize_front_end_uranium_cost(
-        product_mass_kg=product_mass_kg,
-        x_U_nat=project.x_U_nat,
-        x_U_product=project.x_U_product,
-        price_U_nat_per_kg_USD=costs.price_U_nat_per_kg_USD,
-        conversion_per_kgU_USD=costs.conversion_per_kgU_USD,
-        price_SWU_per_SWU_USD=costs.price_SWU_per_SWU_USD,
-        transport_U_nat_per_kg_per_km_USD=costs.transport_U_nat_per_kg_per_km_USD,
-        distance_U_nat_transport_km=project.distance_U_nat_transport_km,
-        transport_U_converted_per_kgU_per_km_USD=costs.transport_U_converted_per_kgU_per_km_USD,
-        distance_U_converted_transport_km=project.distance_U_converted_transport_km,
+    breakdown = FuelBreakdown(
+        U_nat=front_end["cost_U_nat_USD"],
+        transport_U_nat=front_end["cost_transport_U_nat_USD"],
+        conversion=front_end["cost_conversion_USD"],
+        transport_U_converted=front_end["cost_transport_U_converted_USD"],
+        SWU=front_end["cost_enrichment_USD"],
+        transport_U_enriched=cost_transport_enriched,
+        fabrication=cost_fabrication,
+        transport_fresh_fuel=cost_transport_fresh_fuel,
+        back_end=cost_back_end,
+        transport_spent_fuel=cost_transport_spent_fuel,
     )
+    return breakdown.total(), breakdown
 
-    fresh_fuel_mass_UO2_kg = annual_fresh_fuel_mass_kg(project)
 
-    cost_U_nat = front_end["cost_U_nat_USD"]
-    cost_transport_nat = front_end["cost_transport_U_nat_USD"]
-    cost_conversion = front_end["cost_conversion_USD"]
-    cost_transport_converted = front_end["cost_transport_U_converted_USD"]
-    
-    cost_enrichment = front_end["cost_enrichment_USD"]
-    cost_transport_enriched = (
-        product_mass_kg
-        * costs.transport_U_enriched_per_kgU_per_km_USD
-        * project.distance_U_enriched_transport_km
-    )
-
-    cost_fabrication = fresh_fuel_mass_UO2_kg * costs.fabrication_per_kgFreshFuel_USD
-    cost_transport_fresh_fuel = (
-        fresh_fuel_mass_UO2_kg
-        * costs.transport_fuel_per_kgFreshFuel_per_km_USD
-        * project.distance_fresh_fuel_transport_km
-    )
+def fuel_cycle_cost_USD_per_year(project: ProjectParameters, costs: CostParameters) -> float:
+    """Annual fuel cycle cost ($/year), see fuel_cycle."""
+    return fuel_cycle(project, costs)[0]
 
-    cost_back_end = fresh_fuel_mass_UO2_kg * costs.direct_disposal_per_kgSpentFuel_USD
-    
-    # Spent fuel transport (reactor to disposal)
-    cost_transport_spent_fuel = (
-        fresh_fuel_mass_UO2_kg
-        * costs.transport_spent_fuel_per_kg_per_km_USD
-        * project.distance_spent_fuel_transport_km
-    )
 
-    return {
-        "U_nat": cost_U_nat,
-        "transport_U_nat": cost_transport_nat,
-        "conversion": cost_conversion,
-        "transport_U_converted": cost_transport_converted,
-        "SWU": cost_enrichment,
-        "transport_U_enriched": cost_transport_enriched,
-        "fabrication": cost_fabrication,
-        "transport_fresh_fuel": cost_transport_fresh_fuel,
-        "back_end": cost_back_end,
-        "transport_spent_fuel": cost_transport_spent_fuel,
-    }
+def detailed_fuel_cycle_breakdown_USD_per_year(project: ProjectParameters, costs: CostParameters) -> FuelBreakdown:
+    """Breakdown of the annual fuel cycle cost ($/year), see fuel_cycle."""
+    return fuel_cycle(project, costs)[1]
 
 
 # ============================================================
 # 6. LCOE
 # ============================================================
 
-def _get_reactor_construction_schedule(project: ProjectParameters) -> list:
+class _ConstructionSchedule(NamedTuple):
+    """Construction schedule of the reactors, one array element per reactor."""
+    construction_start: np.ndarray  # year when construction starts
+    construction_end: np.ndarray  # year when construction ends
+    operation_end: np.ndarray  # year when reactor shuts down
+
+
+def _get_reactor_construction_schedule(project: ProjectParameters) -> _ConstructionSchedule:
     """
     Calculate construction schedule for each reactor.
     
-    Returns a list of tuples: (reactor_index, construction_start_year, construction_end_year, operation_end_year)
-    where years are 1-indexed (year 1 is the first year).
+    Returns integer arrays of construction start, construction end and operation end years
+    (one element per reactor), where years are 1-indexed (year 1 is the first year).
     """
-    schedule = []
     first_construct = int(round(project.first_reactor_construction_time_years))
-    delay = project.delay_between_reactors_years
     
-    for i in range(project.n_reactors):
-        construction_start = int(round(i * delay)) + 1  # Year when construction starts (1-indexed)
-        construction_end = construction_start + first_construct - 1  # Year when construction ends (1-indexed)
-        operation_end = construction_end + project.reactors_lifetime_years  # Year when reactor shuts down
-        
-        schedule.append((i, construction_start, construction_end, operation_end))
+    # np.rint rounds half to even, like round()
+    construction_start = np.rint(np.arange(project.n_reactors) * project.delay_between_reactors_years).astype(np.int64) + 1
+    construction_end = construction_start + (first_construct - 1)
+    operation_end = construction_end + project.reactors_lifetime_years
     
-    return schedule
+    return _ConstructionSchedule(construction_start, construction_end, operation_end)
+
 
+class _AnnualValues(NamedTuple):
+    """Per-reactor annual values shared by the discounting functions."""
+    opex_per_reactor_USD: float
+    fuel_per_reactor_USD: float
+    energy_per_reactor_MWh: float
+    fuel_breakdown_per_reactor: FuelBreakdown
 
-def _get_reactors_operational_in_year(project: ProjectParameters, year: int) -> int:
+
+@lru_cache(maxsize=32)
+def _precompute_annuals(project: ProjectParameters, costs: CostParameters) -> _AnnualValues:
     """
-    Get the number of reactors operational in a given year (1-indexed).
+    Per-reactor annual OPEX, fuel cycle cost, energy and fuel cycle breakdown.
+
+    Memoized so that the LCOE and both discounted breakdowns run the fuel
+    cycle computation (and its front-end optimization) only once.
     """
-    schedule = _get_reactor_construction_schedule(project)
-    count = 0
-    for _, construction_start, construction_end, operation_end in schedule:
-        if construction_end < year <= operation_end:
-            count += 1
-    return count
+    n_reactors = project.n_reactors
+    fuel_annual, fuel_breakdown = fuel_cycle(project, costs)
+    return _AnnualValues(
+        opex_per_reactor_USD=costs.exploitation_cost_per_year_per_reactor_USD,
+        fuel_per_reactor_USD=fuel_annual / n_reactors,
+        energy_per_reactor_MWh=annual_energy_MWh(project) / n_reactors,
+        fuel_breakdown_per_reactor=FuelBreakdown(*(value / n_reactors for value in fuel_breakdown.values())),
+    )
+
+
+def annuity_pv_factor(r, n_years):
+    """
+    Present value of an annuity of 1 per year paid at the end of years 1..n_years:
+
+        A = (1 - (1 + r)^-n_years) / r      (A = n_years when r = 0)
+
+    Evaluated as -expm1(-n_years * log1p(r)) / r, which stays accurate for small
+    discount rates. Works element-wise on arrays (returns a float for scalars).
+    """
+    r = np.asarray(r, dtype=float)
+    n_years = np.asarray(n_years)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        factor = np.where(r == 0, n_years, -np.expm1(-n_years * np.log1p(r)) / r)
+    return factor if factor.ndim else float(factor)
+
+
+@lru_cache(maxsize=128)
+def capital_recovery_factor(r: float, n_years: int) -> float:
+    """
+    Capital recovery factor: constant annual payment over years 1..n_years
+    that repays a present amount of 1,
+
+        CRF = r * (1 + r)^n_years / ((1 + r)^n_years - 1) = 1 / annuity_pv_factor(r, n_years)
+
+    (CRF = 1 / n_years when r = 0).
+    """
+    return 1.0 / annuity_pv_factor(r, n_years)
+
+
+def _discounted_year_sum(r, first_year, last_year):
+    """
+    Sum of the discount factors (1 + r)^(-year) for year = first_year..last_year.
+
+    Closed form of the finite geometric series, evaluated element-wise on arrays
+    of periods (one per reactor): the annuity factor over the period, discounted
+    back from the year before it starts,
+
+        (1 + r)^-(first_year - 1) * annuity_pv_factor(r, last_year - first_year + 1)
+
+    Empty periods (last_year = first_year - 1) sum to 0.
+    """
+    return (1.0 + np.asarray(r, dtype=float)) ** (1 - first_year) * annuity_pv_factor(r, last_year - first_year + 1)
 
 
-def _get_capex_spending_in_year(project: ProjectParameters, costs: CostParameters, year: int) -> float:
+@lru_cache(maxsize=32)
+def _compute_discounted_everything(project: ProjectParameters, costs: CostParameters) -> dict:
     """
-    Get CAPEX spending in a given year (1-indexed).
-    Each reactor's CAPEX is spread evenly over its construction period.
+    Every discounted quantity of the project, computed in closed form per reactor
+    (no loop over the project years).
+
+    Returns a dictionary with the keys of compute_discounted_costs_breakdown plus
+    "discounted_fuel_breakdown_USD" (the result of compute_discounted_fuel_cycle_breakdown).
+    The public discounting functions are thin views on it. Results are memoized:
+    the returned dict is shared and must not be modified.
     """
+    r = costs.real_discount_rate
+    
+    # Get construction schedule
     schedule = _get_reactor_construction_schedule(project)
-    cost_per_reactor = costs.cost_per_reactor_USD
+    if schedule.operation_end.size == 0:
+        raise ValueError("No reactors in project")
+    
+    # Per-reactor annual values
+    annuals = _precompute_annuals(project, costs)
+    
+    # Closed-form geometric series per reactor over its construction years,
+    # its operation years (from the year after its construction ends until
+    # operation_end) and its dismantling year
+    discounted_construction_years, discounted_reactor_years, discounted_dismantling_events = (
+        discounted_schedule_core(r, schedule.construction_start, schedule.construction_end, schedule.operation_end)
+    )
+    
+    # CAPEX: each reactor's cost is spread evenly over its construction years
+    discounted_capex = 0.0
     first_construct = project.first_reactor_construction_time_years
+    if first_construct > 0:
+        discounted_capex = costs.cost_per_reactor_USD / first_construct * discounted_construction_years
     
-    total_spending = 0.0
-    for _, construction_start, construction_end, _ in schedule:
-        if construction_start <= year <= construction_end:
-            # This reactor is being constructed this year
-            # Spread its cost evenly over construction period
-            annual_spend = cost_per_reactor / first_construct
-            total_spending += annual_spend
+    # Add dismantling costs (each reactor at end of its lifetime)
+    discounted_dismantling = costs.dismantling_cost_per_reactor_USD * discounted_dismantling_events
     
-    return total_spending
+    return {
+        "discounted_capex_USD": discounted_capex,
+        "discounted_opex_USD": discounted_reactor_years * annuals.opex_per_reactor_USD,
+        "discounted_fuel_USD": discounted_reactor_years * annuals.fuel_per_reactor_USD,
+        "discounted_dismantling_USD": discounted_dismantling,
+        "discounted_energy_MWh": discounted_reactor_years * annuals.energy_per_reactor_MWh,
+        "discounted_fuel_breakdown_USD": FuelBreakdown(*(
+            annual_cost_per_reactor * discounted_reactor_years
+            for annual_cost_per_reactor in annuals.fuel_breakdown_per_reactor.values()
+        )),
+    }
 
 
 def compute_lcoe_USD_per_MWh(project: ProjectParameters, costs: CostParameters) -> float:
@@ -365,57 +481,15 @@ def compute_lcoe_USD_per_MWh(project: ProjectParameters, costs: CostParameters)
         - OPEX and fuel costs scale with number of operational reactors
         - Each reactor operates for reactors_lifetime_years after its construction ends
     """
-    r = costs.real_discount_rate
+    discounted = _compute_discounted_everything(project, costs)
     
-    # Get construction schedule
-    schedule = _get_reactor_construction_schedule(project)
-    if not schedule:
-        raise ValueError("No reactors in project")
-    
-    # Find the last year any reactor is operational
-    last_operation_year = max(operation_end for _, _, _, operation_end in schedule)
-    
-    # Per-reactor annual values
-    annual_opex_per_reactor = costs.exploitation_cost_per_year_per_reactor_USD
-    annual_fuel_per_reactor = fuel_cycle_cost_USD_per_year(project, costs) / project.n_reactors
-    annual_energy_per_reactor = annual_energy_MWh(project) / project.n_reactors  # MWh/year per reactor
-    
-    # Total dismantling cost
-    total_dismantling = project.n_reactors * costs.dismantling_cost_per_reactor_USD
-    
-    discounted_costs = 0.0
-    discounted_energy = 0.0
-    
-    # Iterate over all years from 1 to last_operation_year
-    for year in range(1, last_operation_year + 1):
-        discount_factor = (1.0 + r) ** (-year)
-        
-        # CAPEX spending this year
-        year_capex = _get_capex_spending_in_year(project, costs, year)
-        
-        # Number of operational reactors this year
-        n_operational = _get_reactors_operational_in_year(project, year)
-        
-        # OPEX and fuel costs (only for operational reactors)
-        year_opex = n_operational * annual_opex_per_reactor
-        year_fuel = n_operational * annual_fuel_per_reactor
-        
-        # Energy production (only from operational reactors)
-        year_energy = n_operational * annual_energy_per_reactor
-        
-        # Total cost this year
-        year_cost = year_capex + year_opex + year_fuel
-        
-        discounted_costs += year_cost * discount_factor
-        discounted_energy += year_energy * discount_factor
-    
-    # Add dismantling costs (each reactor at end of its lifetime)
-    for _, _, construction_end, operation_end in schedule:
-        if total_dismantling > 0:
-            dismantling_year = operation_end
-            dismantling_discount_factor = (1.0 + r) ** (-dismantling_year)
-            dismantling_per_reactor = costs.dismantling_cost_per_reactor_USD
-            discounted_costs += dismantling_per_reactor * dismantling_discount_factor
+    discounted_costs = math.fsum((
+        discounted["discounted_capex_USD"],
+        discounted["discounted_opex_USD"],
+        discounted["discounted_fuel_USD"],
+        discounted["discounted_dismantling_USD"],
+    ))
+    discounted_energy = discounted["discounted_energy_MWh"]
     
     if discounted_energy <= 0:
         raise ValueError("Discounted energy is zero or negative in compute_lcoe_USD_per_MWh().")
@@ -435,125 +509,172 @@ def compute_discounted_costs_breakdown(project: ProjectParameters, costs: CostPa
     - "discounted_dismantling_USD": total discounted dismantling cost
     - "discounted_energy_MWh": total discounted energy production
     """
-    r = costs.real_discount_rate
-    
-    # Get construction schedule
-    schedule = _get_reactor_construction_schedule(project)
-    if not schedule:
-        raise ValueError("No reactors in project")
-    
-    # Find the last year any reactor is operational
-    last_operation_year = max(operation_end for _, _, _, operation_end in schedule)
-    
-    # Per-reactor annual values
-    annual_opex_per_reactor = costs.exploitation_cost_per_year_per_reactor_USD
-    annual_fuel_per_reactor = fuel_cycle_cost_USD_per_year(project, costs) / project.n_reactors
-    annual_energy_per_reactor = annual_energy_MWh(project) / project.n_reactors  # MWh/year per reactor
-    
-    discounted_capex = 0.0
-    discounted_opex = 0.0
-    discounted_fuel = 0.0
-    discounted_energy = 0.0
-    
-    # Iterate over all years from 1 to last_operation_year
-    for year in range(1, last_operation_year + 1):
-        discount_factor = (1.0 + r) ** (-year)
-        
-        # CAPEX spending this year
-        year_capex = _get_capex_spending_in_year(project, costs, year)
-        discounted_capex += year_capex * discount_factor
-        
-        # Number of operational reactors this year
-        n_operational = _get_reactors_operational_in_year(project, year)
-        
-        # OPEX and fuel costs (only for operational reactors)
-        year_opex = n_operational * annual_opex_per_reactor
-        year_fuel = n_operational * annual_fuel_per_reactor
-        discounted_opex += year_opex * discount_factor
-        discounted_fuel += year_fuel * discount_factor
-        
-        # Energy production (only from operational reactors)
-        year_energy = n_operational * annual_energy_per_reactor
-        discounted_energy += year_energy * discount_factor
-    
-    # Add dismantling costs (each reactor at end of its lifetime)
-    discounted_dismantling = 0.0
-    for _, _, _, operation_end in schedule:
-        dismantling_per_reactor = costs.dismantling_cost_per_reactor_USD
-        if dismantling_per_reactor > 0:
-            dismantling_year = operation_end
-            dismantling_discount_factor = (1.0 + r) ** (-dismantling_year)
-            discounted_dismantling += dismantling_per_reactor * dismantling_discount_factor
-    
+    discounted = _compute_discounted_everything(project, costs)
     return {
-        "discounted_capex_USD": discounted_capex,
-        "discounted_opex_USD": discounted_opex,
-        "discounted_fuel_USD": discounted_fuel,
-        "discounted_dismantling_USD": discounted_dismantling,
-        "discounted_energy_MWh": discounted_energy,
+        key: discounted[key]
+        for key in (
+            "discounted_capex_USD",
+            "discounted_opex_USD",
+            "discounted_fuel_USD",
+            "discounted_dismantling_USD",
+            "discounted_energy_MWh",
+        )
     }
 
 
-def compute_discounted_fuel_cycle_breakdown(project: ProjectParameters, costs: CostParameters) -> dict:
+def compute_discounted_fuel_cycle_breakdown(project: ProjectParameters, costs: CostParameters) -> FuelBreakdown:
     """
     Compute discounted fuel cycle costs broken down by each step.
     Handles staggered construction - fuel costs scale with number of operational reactors.
     
-    Returns a dictionary with discounted costs for each fuel cycle component:
-    - "U_nat": natural uranium
-    - "transport_U_nat": natural uranium transport (mine to conversion)
-    - "conversion": conversion
-    - "transport_U_converted": converted uranium transport (conversion to enrichment)
-    - "SWU": enrichment
-    - "transport_U_enriched": enriched uranium transport (enrichment to fabrication)
-    - "fabrication": fuel fabrication
-    - "transport_fresh_fuel": fresh fuel transport (fabrication to reactor)
-    - "back_end": back-end disposal
-    - "transport_spent_fuel": spent fuel transport (reactor to disposal)
+    Returns a FuelBreakdown of the discounted cost of each fuel cycle step
+    (natural uranium, conversion, enrichment, fabrication, back-end disposal
+    and the transports between them).
     """
-    r = costs.real_discount_rate
-    
-    # Get construction schedule
-    schedule = _get_reactor_construction_schedule(project)
-    if not schedule:
+    return _compute_discounted_everything(project, costs)["discounted_fuel_breakdown_USD"]
+
+
+def compute_lcoe_batch(projects, costs) -> np.ndarray:
+    """
+    LCOE in $/MWh for N scenarios at once (e.g. for sensitivity analyses).
+
+    `projects` and `costs` are ProjectParameters / CostParameters instances or
+    sequences of them; a single instance (or a sequence of length 1) is used
+    for every scenario. Returns an array of N LCOE values.
+
+    Same model as compute_lcoe_USD_per_MWh, evaluated with NumPy arrays along
+    a scenario axis: the front-end optimization uses a batched tails assay grid
+    (see optimize_front_end_uranium_cost_batch), the reactor schedules of all
+    scenarios are padded to the largest plant and the discounted sums use the
+    same closed-form series.
+    """
+    if isinstance(projects, ProjectParameters):
+        projects = [projects]
+    if isinstance(costs, CostParameters):
+        costs = [costs]
+    n_scenarios = max(len(projects), len(costs))
+    if {len(projects), len(costs)} - {1, n_scenarios}:
+        raise ValueError("projects and costs must have the same length (or a length of 1) in compute_lcoe_batch().")
+
+    # Fields are read with attrgetter + fromiter: the loop over the scenarios
+    # runs in C instead of a Python-level getattr per scenario
+    def p(name, dtype=float):
+        """Array of a ProjectParameters field over the scenarios."""
+        values = np.fromiter(map(attrgetter(name), projects), dtype=dtype, count=len(projects))
+        return np.broadcast_to(values, (n_scenarios,))
+
+    def c(name):
+        """Array of a CostParameters field over the scenarios."""
+        values = np.fromiter(map(attrgetter(name), costs), dtype=float, count=len(costs))
+        return np.broadcast_to(values, (n_scenarios,))
+
+    n_reactors = p("n_reactors", np.int64)
+    if np.any(n_reactors < 1):
         raise ValueError("No reactors in project")
-    
-    # Find the last year any reactor is operational
-    last_operation_year = max(operation_end for _, _, _, operation_end in schedule)
-    
-    # Get annual fuel cycle breakdown (for full plant - we'll scale per reactor)
-    annual_breakdown_full = detailed_fuel_cycle_breakdown_USD_per_year(project, costs)
-    
-    # Convert to per-reactor costs
-    annual_breakdown_per_reactor = {
-        key: value / project.n_reactors 
-        for key, value in annual_breakdown_full.items()
-    }
-    
-    # Discount each component over the operational years, scaling by number of operational reactors
-    discounted_breakdown = {}
-    for key, annual_cost_per_reactor in annual_breakdown_per_reactor.items():
-        discounted_total = 0.0
-        for year in range(1, last_operation_year + 1):
-            n_operational = _get_reactors_operational_in_year(project, year)
-            if n_operational > 0:
-                discount_factor = (1.0 + r) ** (-year)
-                year_cost = n_operational * annual_cost_per_reactor
-                discounted_total += year_cost * discount_factor
-        discounted_breakdown[key] = discounted_total
-    
-    return discounted_breakdown
+    r = c("real_discount_rate")
+
+    # --- Annual energy and fuel masses ---
+    energy = n_reactors * p("power_electric_per_reactor_MWe") * 8760.0 * p("net_capacity_factor")
+    fresh_fuel_mass_UO2_kg = (
+        p("assemblies_per_core") * p("fuel_mass_per_assembly_kg") * p("batch_fraction")
+        * n_reactors / p("cycle_length_years")
+    )
+    product_mass_kg = UO2_to_U(fresh_fuel_mass_UO2_kg)
+
+    # --- Annual fuel cycle cost ---
+    front_end = optimize_front_end_uranium_cost_batch(
+        product_mass_kg=product_mass_kg,
+        x_U_nat=p("x_U_nat"),
+        x_U_product=p("x_U_product"),
+        price_U_nat_per_kg_USD=c("price_U_nat_per_kg_USD"),
+        conversion_per_kgU_USD=c("conversion_per_kgU_USD"),
+        price_SWU_per_SWU_USD=c("price_SWU_per_SWU_USD"),
+        transport_U_nat_per_kg_per_km_USD=c("transport_U_nat_per_kg_per_km_USD"),
+        distance_U_nat_transport_km=p("distance_U_nat_transport_km"),
+        transport_U_converted_per_kgU_per_km_USD=c("transport_U_converted_per_kgU_per_km_USD"),
+        distance_U_converted_transport_km=p("distance_U_converted_transport_km"),
+    )
+    fuel_annual = (
+        front_end["cost_U_nat_USD"]
+        + front_end["cost_transport_U_nat_USD"]
+        + front_end["cost_conversion_USD"]
+        + front_end["cost_transport_U_converted_USD"]
+        + front_end["cost_enrichment_USD"]
+        + product_mass_kg * c("transport_U_enriched_per_kgU_per_km_USD") * p("distance_U_enriched_transport_km")
+        + fresh_fuel_mass_UO2_kg * (
+            c("fabrication_per_kgFreshFuel_USD")
+            + c("transport_fuel_per_kgFreshFuel_per_km_USD") * p("distance_fresh_fuel_transport_km")
+            + c("direct_disposal_per_kgSpentFuel_USD")
+            + c("transport_spent_fuel_per_kg_per_km_USD") * p("distance_spent_fuel_transport_km")
+        )
+    )
+
+    # --- Construction schedules (scenarios x reactors, padded to the largest plant) ---
+    reactor_index = np.arange(n_reactors.max())
+    is_reactor = reactor_index < n_reactors[:, None]
+    first_construct = p("first_reactor_construction_time_years")
+    construction_years = np.rint(first_construct).astype(np.int64)[:, None]
+    construction_start = np.rint(reactor_index * p("delay_between_reactors_years")[:, None]).astype(np.int64) + 1
+    construction_end = construction_start + construction_years - 1
+    operation_end = construction_end + p("reactors_lifetime_years", np.int64)[:, None]
+
+    # --- Discounting (closed-form geometric series per reactor) ---
+    r_col = r[:, None]
+    discounted_reactor_years = np.where(
+        is_reactor, _discounted_year_sum(r_col, construction_end + 1, operation_end), 0.0
+    ).sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        annual_capex_spend = np.where(first_construct > 0, c("cost_per_reactor_USD") / first_construct, 0.0)
+    discounted_construction_years = np.where(
+        is_reactor, _discounted_year_sum(r_col, construction_start, construction_end), 0.0
+    ).sum(axis=1)
+    discounted_capex = annual_capex_spend * discounted_construction_years
+    dismantling_factors = np.where(is_reactor, (1.0 + r_col) ** (-operation_end), 0.0)
+    discounted_dismantling = c("dismantling_cost_per_reactor_USD") * dismantling_factors.sum(axis=1)
+
+    annual_opex_per_reactor = c("exploitation_cost_per_year_per_reactor_USD")
+    discounted_costs = (
+        discounted_capex
+        + discounted_reactor_years * (annual_opex_per_reactor + fuel_annual / n_reactors)
+        + discounted_dismantling
+    )
+    discounted_energy = discounted_reactor_years * energy / n_reactors
+    if np.any(discounted_energy <= 0):
+        raise ValueError("Discounted energy is zero or negative in compute_lcoe_batch().")
+
+    return discounted_costs / discounted_energy
 
 
 # ============================================================
 # 7. MAIN ENTRY POINT (EXAMPLE CALCULATION)
 # ============================================================
 
-def main():
-    project = ProjectParameters()
-    costs = CostParameters()
+class ScenarioResults(NamedTuple):
+    """Inputs and outputs of a scenario, as shown in the report."""
+    project: ProjectParameters
+    costs: CostParameters
+    energy_MWh: float
+    product_mass_kg: float
+    front_end: dict
+    fresh_fuel_mass_UO2_kg: float
+    capex_total_USD: float
+    dismantling_total_USD: float
+    opex_annual_USD: float
+    fuel_annual_USD: float
+    fuel_breakdown_USD: FuelBreakdown
+    lcoe_USD_per_MWh: float
+
+
+@lru_cache(maxsize=32)
+def compute_results(project: ProjectParameters, costs: CostParameters) -> ScenarioResults:
+    """
+    Every output of a scenario, computed once per (project, costs).
 
-    energy = annual_energy_MWh(project)
+    A long-lived process (notebook, web app) imports the model and compiles
+    its kernels once, then each scenario only costs the model arithmetic, and
+    repeated scenarios reuse the cached results. The dicts are shared and
+    must not be modified.
+    """
     product_mass_kg = annual_enriched_U_mass_kg(project)
     front_end = optimize_front_end_uranium_cost(
         product_mass_kg=product_mass_kg,
@@ -567,91 +688,156 @@ def main():
         transport_U_converted_per_kgU_per_km_USD=costs.transport_U_converted_per_kgU_per_km_USD,
         distance_U_converted_transport_km=project.distance_U_converted_transport_km,
     )
-    fresh_fuel_mass_UO2_kg = annual_fresh_fuel_mass_kg(project)
+    fuel_annual, fuel_breakdown = fuel_cycle(project, costs)
+    return ScenarioResults(
+        project=project,
+        costs=costs,
+        energy_MWh=annual_energy_MWh(project),
+        product_mass_kg=product_mass_kg,
+        front_end=front_end,
+        fresh_fuel_mass_UO2_kg=annual_fresh_fuel_mass_kg(project),
+        capex_total_USD=project.n_reactors * costs.cost_per_reactor_USD,
+        dismantling_total_USD=project.n_reactors * costs.dismantling_cost_per_reactor_USD,
+        opex_annual_USD=project.n_reactors * costs.exploitation_cost_per_year_per_reactor_USD,
+        fuel_annual_USD=fuel_annual,
+        fuel_breakdown_USD=fuel_breakdown,
+        lcoe_USD_per_MWh=compute_lcoe_USD_per_MWh(project, costs),
+    )
+
+
+def compute_all_outputs(project: ProjectParameters, costs: CostParameters) -> dict:
+    """
+    Every output of the model for a scenario, in a single call (used by the app).
+
+    Combines compute_results (annual values and LCOE) with the discounted
+    breakdowns; all of them share the same memoized fuel cycle and discounting
+    computations, so each intermediate is computed once. Returns a new dict
+    (with copies of the nested dicts; the FuelBreakdown values are read-only)
+    that the caller may modify.
+    """
+    results = compute_results(project, costs)
+    discounted = _compute_discounted_everything(project, costs)
+    return {
+        "energy": results.energy_MWh,
+        "product_mass_kg": results.product_mass_kg,
+        "front_end": dict(results.front_end),
+        "fresh_fuel_mass_UO2_kg": results.fresh_fuel_mass_UO2_kg,
+        "capex_total": results.capex_total_USD,
+        "dismantling_total": results.dismantling_total_USD,
+        "opex_annual": results.opex_annual_USD,
+        "fuel_annual": results.fuel_annual_USD,
+        "fuel_breakdown": results.fuel_breakdown_USD,
+        "lcoe": results.lcoe_USD_per_MWh,
+        "discounted_breakdown": compute_discounted_costs_breakdown(project, costs),
+        "fuel_breakdown_discounted": discounted["discounted_fuel_breakdown_USD"],
+    }
+
 
-    capex_total = compute_capex_USD(project, costs)
-    dismantling_total = project.n_reactors * costs.dismantling_cost_per_reactor_USD
-    opex_annual = compute_opex_total_USD_per_year(project, costs)
-    fuel_annual = fuel_cycle_cost_USD_per_year(project, costs)
-    fuel_breakdown = detailed_fuel_cycle_breakdown_USD_per_year(project, costs)
-    lcoe = compute_lcoe_USD_per_MWh(project, costs)
-
-    # ------------------------------------------------------------
-    # 1) INPUT PARAMETERS - PROJECT
-    # ------------------------------------------------------------
-    print("=== Nuclear project – VVER in Serbia (simplified model) ===")
-    print(">> Input parameters - Project")
-    print(f"  country                           : {project.country}")
-    print(f"  reactor_type                      : {project.reactor_type}")
-    print(f"  n_reactors                        : {project.n_reactors}")
-    print(f"  power_electric_per_reactor_MWe     : {project.power_electric_per_reactor_MWe:.0f} MWe")
-    print(f"  net_capacity_factor               : {project.net_capacity_factor:.3f}")
-    print(f"  first_reactor_construction_time_years: {project.first_reactor_construction_time_years:.1f} years")
-    print(f"  delay_between_reactors_years         : {project.delay_between_reactors_years:.1f} years")
-    print(f"  reactors_lifetime_years           : {project.reactors_lifetime_years} years")
-    print(f"  x_U_nat                           : {project.x_U_nat:.5f}")
-    print(f"  x_U_product                       : {project.x_U_product:.5f}")
-    print(f"  assemblies_per_core               : {project.assemblies_per_core}")
-    print(f"  fuel_mass_per_assembly_kg         : {project.fuel_mass_per_assembly_kg:.1f} kgUO2")
-    print(f"  batch_fraction                    : {project.batch_fraction:.3f}")
-    print(f"  cycle_length_years                : {project.cycle_length_years:.3f} years")
-    print(f"  spent_fuel_backend                : {project.spent_fuel_backend}")
-    print(f"  distance_U_nat_transport_km        : {project.distance_U_nat_transport_km:.0f} km")
-    print(f"  distance_U_converted_transport_km  : {project.distance_U_converted_transport_km:.0f} km")
-    print(f"  distance_U_enriched_transport_km  : {project.distance_U_enriched_transport_km:.0f} km")
-    print(f"  distance_fresh_fuel_transport_km   : {project.distance_fresh_fuel_transport_km:.0f} km")
-    print(f"  distance_spent_fuel_transport_km   : {project.distance_spent_fuel_transport_km:.0f} km")
-    print()
-
-    # ------------------------------------------------------------
-    # 2) INPUT PARAMETERS - COSTS
-    # ------------------------------------------------------------
-    print(">> Input parameters - Costs")
-    print(f"  real_discount_rate                : {costs.real_discount_rate:.3f}")
-    print(f"  cost_per_reactor_USD              : {costs.cost_per_reactor_USD/1e9:.3f} B$ ({costs.cost_per_reactor_USD:,.0f} $)")
-    print(f"  dismantling_cost_per_reactor_USD   : {costs.dismantling_cost_per_reactor_USD/1e9:.3f} B$ ({costs.dismantling_cost_per_reactor_USD:,.0f} $)")
-    print(f"  exploitation_cost_per_year_per_reactor_USD : {costs.exploitation_cost_per_year_per_reactor_USD/1e6:.2f} M$/year ({costs.exploitation_cost_per_year_per_reactor_USD:,.0f} $/year)")
-    print(f"  price_U_nat_per_kg_USD            : {costs.price_U_nat_per_kg_USD:.1f} $/kgU")
-    print(f"  conversion_per_kgU_USD            : {costs.conversion_per_kgU_USD:.1f} $/kgU")
-    print(f"  price_SWU_per_SWU_USD             : {costs.price_SWU_per_SWU_USD:.1f} $/SWU")
-    print(f"  fabrication_per_kgFreshFuel_USD   : {costs.fabrication_per_kgFreshFuel_USD:.1f} $/kg fresh fuel")
-    print(f"  direct_disposal_per_kgSpentFuel_USD : {costs.direct_disposal_per_kgSpentFuel_USD:.1f} $/kg spent fuel")
-    print(f"  transport_U_nat_per_kg_per_km_USD : {costs.transport_U_nat_per_kg_per_km_USD:.3e} $/kgU/km")
-    print(f"  transport_U_converted_per_kgU_per_km_USD : {costs.transport_U_converted_per_kgU_per_km_USD:.3e} $/kgU/km")
-    print(f"  transport_U_enriched_per_kgU_per_km_USD : {costs.transport_U_enriched_per_kgU_per_km_USD:.3e} $/kgU/km")
-    print(f"  transport_fuel_per_kgFreshFuel_per_km_USD : {costs.transport_fuel_per_kgFreshFuel_per_km_USD:.3e} $/kg/km")
-    print(f"  transport_spent_fuel_per_kg_per_km_USD : {costs.transport_spent_fuel_per_kg_per_km_USD:.3e} $/kg/km")
-    print()
-
-    # ------------------------------------------------------------
-    # 3) OUTPUT PARAMETERS - PROJECT
-    # ------------------------------------------------------------
-    print(">> Output parameters - Project")
-    print(f"  Net annual production              : {energy/1e6:.3f} TWh/year")
-    print(f"  Optimal x_tails                    : {front_end['x_tails_opt']:.5f}")
-    print(f"  Annual fresh fuel (UO2)           : {fresh_fuel_mass_UO2_kg/1e3:.3f} tUO2/year")
-    print(f"  Annual enriched U (U)              : {product_mass_kg/1e3:.3f} tU/year")
-    print(f"  Optimal natural U feed             : {front_end['M_U_nat_kg']/1e3:.3f} tU/year")
-    print()
-
-    # ------------------------------------------------------------
-    # 4) OUTPUT PARAMETERS - COSTS
-    # ------------------------------------------------------------
-    print(">> Output parameters - Costs")
-    print(f"  Total CAPEX                        : {capex_total/1e9:.3f} B$ ({capex_total:,.0f} $)")
-    print(f"  Total dismantling cost              : {dismantling_total/1e9:.3f} B$ ({dismantling_total:,.0f} $)")
-    print(f"  OPEX (excl. fuel)                  : {opex_annual/1e6:.2f} M$/year ({opex_annual:,.0f} $/year)")
-    print(f"  Fuel cycle cost (total)             : {fuel_annual/1e6:.2f} M$/year ({fuel_annual:,.0f} $/year)")
-    print("  Fuel cycle breakdown:")
-    for k, v in fuel_breakdown.items():
-        print(f"    - {k:20s}: {v/1e6:.3f} M$/year ({v:,.0f} $/year)")
-    print()
-
-    # ------------------------------------------------------------
-    # 5) RESULTING LCOE
-    # ------------------------------------------------------------
-    print(">> Resulting LCOE")
-    print(f"  LCOE ≈ {lcoe:.1f} $/MWh")
+# Report layout: one placeholder per value, filled by render_report() with str.format_map
+_REPORT_TEMPLATE = """\
+=== Nuclear project – VVER in Serbia (simplified model) ===
+>> Input parameters - Project
+  country                           : {project.country}
+  reactor_type                      : {project.reactor_type}
+  n_reactors                        : {project.n_reactors}
+  power_electric_per_reactor_MWe     : {project.power_electric_per_reactor_MWe:.0f} MWe
+  net_capacity_factor               : {project.net_capacity_factor:.3f}
+  first_reactor_construction_time_years: {project.first_reactor_construction_time_years:.1f} years
+  delay_between_reactors_years         : {project.delay_between_reactors_years:.1f} years
+  reactors_lifetime_years           : {project.reactors_lifetime_years} years
+  x_U_nat                           : {project.x_U_nat:.5f}
+  x_U_product                       : {project.x_U_product:.5f}
+  assemblies_per_core               : {project.assemblies_per_core}
+  fuel_mass_per_assembly_kg         : {project.fuel_mass_per_assembly_kg:.1f} kgUO2
+  batch_fraction                    : {project.batch_fraction:.3f}
+  cycle_length_years                : {project.cycle_length_years:.3f} years
+  spent_fuel_backend                : {project.spent_fuel_backend}
+  distance_U_nat_transport_km        : {project.distance_U_nat_transport_km:.0f} km
+  distance_U_converted_transport_km  : {project.distance_U_converted_transport_km:.0f} km
+  distance_U_enriched_transport_km  : {project.distance_U_enriched_transport_km:.0f} km
+  distance_fresh_fuel_transport_km   : {project.distance_fresh_fuel_transport_km:.0f} km
+  distance_spent_fuel_transport_km   : {project.distance_spent_fuel_transport_km:.0f} km
+
+>> Input parameters - Costs
+  real_discount_rate                : {costs.real_discount_rate:.3f}
+  cost_per_reactor_USD              : {cost_per_reactor_B:.3f} B$ ({costs.cost_per_reactor_USD:,.0f} $)
+  dismantling_cost_per_reactor_USD   : {dismantling_cost_per_reactor_B:.3f} B$ ({costs.dismantling_cost_per_reactor_USD:,.0f} $)
+  exploitation_cost_per_year_per_reactor_USD : {exploitation_cost_per_reactor_M:.2f} M$/year ({costs.exploitation_cost_per_year_per_reactor_USD:,.0f} $/year)
+  price_U_nat_per_kg_USD            : {costs.price_U_nat_per_kg_USD:.1f} $/kgU
+  conversion_per_kgU_USD            : {costs.conversion_per_kgU_USD:.1f} $/kgU
+  price_SWU_per_SWU_USD             : {costs.price_SWU_per_SWU_USD:.1f} $/SWU
+  fabrication_per_kgFreshFuel_USD   : {costs.fabrication_per_kgFreshFuel_USD:.1f} $/kg fresh fuel
+  direct_disposal_per_kgSpentFuel_USD : {costs.direct_disposal_per_kgSpentFuel_USD:.1f} $/kg spent fuel
+  transport_U_nat_per_kg_per_km_USD : {costs.transport_U_nat_per_kg_per_km_USD:.3e} $/kgU/km
+  transport_U_converted_per_kgU_per_km_USD : {costs.transport_U_converted_per_kgU_per_km_USD:.3e} $/kgU/km
+  transport_U_enriched_per_kgU_per_km_USD : {costs.transport_U_enriched_per_kgU_per_km_USD:.3e} $/kgU/km
+  transport_fuel_per_kgFreshFuel_per_km_USD : {costs.transport_fuel_per_kgFreshFuel_per_km_USD:.3e} $/kg/km
+  transport_spent_fuel_per_kg_per_km_USD : {costs.transport_spent_fuel_per_kg_per_km_USD:.3e} $/kg/km
+
+>> Output parameters - Project
+  Net annual production              : {energy_TWh:.3f} TWh/year
+  Optimal x_tails                    : {front_end[x_tails_opt]:.5f}
+  Annual fresh fuel (UO2)           : {fresh_fuel_mass_UO2_t:.3f} tUO2/year
+  Annual enriched U (U)              : {product_mass_t:.3f} tU/year
+  Optimal natural U feed             : {U_nat_feed_t:.3f} tU/year
+
+>> Output parameters - Costs
+  Total CAPEX                        : {capex_total_B:.3f} B$ ({capex_total:,.0f} $)
+  Total dismantling cost              : {dismantling_total_B:.3f} B$ ({dismantling_total:,.0f} $)
+  OPEX (excl. fuel)                  : {opex_annual_M:.2f} M$/year ({opex_annual:,.0f} $/year)
+  Fuel cycle cost (total)             : {fuel_annual_M:.2f} M$/year ({fuel_annual:,.0f} $/year)
+  Fuel cycle breakdown:
+{fuel_breakdown_lines}
+
+>> Resulting LCOE
+  LCOE ≈ {lcoe:.1f} $/MWh
+"""
+
+
+def render_report(results: ScenarioResults) -> str:
+    """
+    Text report of the inputs, outputs and LCOE of a scenario.
+
+    Returned as a single string (rather than printed line by line) so that it
+    can be written in one call, or reused without I/O in parameter sweeps.
+    """
+    project, costs = results.project, results.costs
+
+    fuel_breakdown_lines = "\n".join(
+        f"    - {k:20s}: {v/1e6:.3f} M$/year ({v:,.0f} $/year)" for k, v in results.fuel_breakdown_USD.items()
+    )
+
+    return _REPORT_TEMPLATE.format_map({
+        "project": project,
+        "costs": costs,
+        "cost_per_reactor_B": costs.cost_per_reactor_USD / 1e9,
+        "dismantling_cost_per_reactor_B": costs.dismantling_cost_per_reactor_USD / 1e9,
+        "exploitation_cost_per_reactor_M": costs.exploitation_cost_per_year_per_reactor_USD / 1e6,
+        "energy_TWh": results.energy_MWh / 1e6,
+        "front_end": results.front_end,
+        "fresh_fuel_mass_UO2_t": results.fresh_fuel_mass_UO2_kg / 1e3,
+        "product_mass_t": results.product_mass_kg / 1e3,
+        "U_nat_feed_t": results.front_end["M_U_nat_kg"] / 1e3,
+        "capex_total": results.capex_total_USD,
+        "capex_total_B": results.capex_total_USD / 1e9,
+        "dismantling_total": results.dismantling_total_USD,
+        "dismantling_total_B": results.dismantling_total_USD / 1e9,
+        "opex_annual": results.opex_annual_USD,
+        "opex_annual_M": results.opex_annual_USD / 1e6,
+        "fuel_annual": results.fuel_annual_USD,
+        "fuel_annual_M": results.fuel_annual_USD / 1e6,
+        "fuel_breakdown_lines": fuel_breakdown_lines,
+        "lcoe": results.lcoe_USD_per_MWh,
+    })
+
+
+def format_report(project: ProjectParameters, costs: CostParameters) -> str:
+    """Text report of a scenario (see render_report)."""
+    return render_report(compute_results(project, costs))
+
+
+def main():
+    sys.stdout.write(format_report(ProjectParameters(), CostParameters()))
 
 
 if __name__ == "__main__":
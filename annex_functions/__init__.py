@@ -0,0 +1,4 @@
+"""
+Annex functions of the LCOE model: unit conversions, energy production,
+fuel masses and front-end fuel cycle optimization.
+"""
@@ -0,0 +1,107 @@
+"""
+Scalar numeric kernels of the LCOE model working on plain floats, ints and
+NumPy arrays (no dataclasses), so that Numba can compile them when it is
+installed. The public functions unpack the parameter dataclasses and call them.
+"""
+
+import math
+
+try:
+    from numba import njit, vectorize
+except ImportError:  # Numba is optional: the kernels then run as plain Python
+    njit = vectorize = None
+
+
+# Fast-math flags for kernels that use inf (or NaN) as a value: without "nnan"
+# and "ninf", with which LLVM may assume that no float is ever inf or NaN and
+# fold away the comparisons against them, and without "nsz", which together
+# with "reassoc" lets LLVM fold math.isfinite(x) to True
+FASTMATH_INF_SAFE = {"arcp", "contract", "afn", "reassoc"}
+
+
+def _jit(func=None, *, fastmath=True):
+    """
+    Compile `func` with Numba when it is installed, otherwise return it unchanged.
+
+    Used as @_jit, or as @_jit(fastmath=FASTMATH_INF_SAFE) for kernels that
+    rely on inf or NaN values.
+    """
+    if func is None:
+        return lambda func: _jit(func, fastmath=fastmath)
+    if njit is None:
+        return func
+    return njit(cache=True, fastmath=fastmath)(func)
+
+
+def _vectorize(func=None, *, fastmath=True):
+    """
+    Compile `func` into a float64 NumPy ufunc with Numba when it is installed,
+    otherwise return it unchanged (it must then be written with NumPy functions
+    so that it accepts both scalars and arrays).
+
+    Takes the same `fastmath` argument as _jit.
+    """
+    if func is None:
+        return lambda func: _vectorize(func, fastmath=fastmath)
+    if vectorize is None:
+        return func
+    return vectorize(["float64(float64)"], cache=True, fastmath=fastmath)(func)
+
+
+### Energy production and fuel masses ###
+
+@_jit
+def annual_energy_MWh_core(n_reactors, power_electric_per_reactor_MWe, net_capacity_factor):
+    """Net annual electricity production in MWh."""
+    hours_year = 8760.0
+    return n_reactors * power_electric_per_reactor_MWe * hours_year * net_capacity_factor
+
+
+@_jit
+def annual_fresh_fuel_mass_kg_core(
+    assemblies_per_core, fuel_mass_per_assembly_kg, batch_fraction, n_reactors, cycle_length_years
+):
+    """Annual fresh fuel mass loaded in all reactors (kg/year)."""
+    fresh_fuel_mass_per_cycle_per_reactor_kg = assemblies_per_core * fuel_mass_per_assembly_kg * batch_fraction
+    return fresh_fuel_mass_per_cycle_per_reactor_kg * n_reactors / cycle_length_years
+
+
+### Discounting ###
+
+@_jit
+def discounted_schedule_core(r, construction_start, construction_end, operation_end):
+    """
+    Discounted sums over the reactors of a plant (one array element per reactor).
+
+    Returns (discounted construction years, discounted operation years,
+    discounted dismantling events): multiplied by the annual CAPEX spending,
+    the annual per-reactor OPEX / fuel / energy and the dismantling cost per
+    reactor, they give the corresponding discounted totals.
+
+    Each period is the closed-form series of _discounted_year_sum in the main
+    script, with log(1 + r) evaluated once for the whole plant: each reactor
+    then only costs exp/expm1 calls.
+    """
+    construction_years = 0.0
+    operation_years = 0.0
+    dismantling_events = 0.0
+    if r == 0.0:
+        for i in range(operation_end.size):
+            construction_years += construction_end[i] - construction_start[i] + 1
+            operation_years += operation_end[i] - construction_end[i]
+            dismantling_events += 1.0
+        return float(construction_years), float(operation_years), float(dismantling_events)
+
+    log_growth = math.log1p(r)
+    for i in range(operation_end.size):
+        # (1 + r)^-(first_year - 1) * annuity factor over the period, for both periods
+        construction_years += (
+            math.exp((1 - construction_start[i]) * log_growth)
+            * -math.expm1((construction_start[i] - construction_end[i] - 1) * log_growth)
+        )
+        operation_years += (
+            math.exp(-construction_end[i] * log_growth)
+            * -math.expm1((construction_end[i] - operation_end[i]) * log_growth)
+        )
+        dismantling_events += math.exp(-operation_end[i] * log_growth)
+    return float(construction_years / r), float(operation_years / r), float(dismantling_events)
@@ -0,0 +1,75 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True
+"""
+Compiled version of the tails-assay grid search of annex_cost_functions.
+
+Same algorithm as annex_cost_functions._search_tails, with unboxed doubles and
+direct calls to the C log(). Build it with:
+
+    python setup.py build_ext --inplace
+"""
+
+from libc.math cimport fabs, isfinite, log, log1p
+
+
+cdef inline double _V_swu(double x):
+    """V(x) = (1 - 2x) * ln((1 - x) / x), with ln((1 - x) / x) = log1p(-x) - log(x)"""
+    return (1.0 - 2.0 * x) * (log1p(-x) - log(x))
+
+
+def search_tails(
+    double product_mass_kg,
+    double x_U_nat,
+    double x_U_product,
+    double feed_unit_cost_USD,
+    double price_SWU_per_SWU_USD,
+    double tails_min,
+    double tails_max,
+    Py_ssize_t n_steps,
+):
+    """
+    Grid search of the tails assay over n_steps points from tails_min (included)
+    to tails_max (excluded); returns (found, x_tails_best).
+    """
+    cdef double V_product = _V_swu(x_U_product)
+    cdef double V_nat = _V_swu(x_U_nat)
+    cdef double step = (tails_max - tails_min) / n_steps
+    cdef double x_tails, denominator, feed_mass_kg, tails_mass_kg, swu_required, total_cost
+    cdef double best_cost = 0.0
+    cdef double x_tails_best = tails_min
+    cdef bint found = False
+    cdef bint non_degenerate, valid
+    cdef Py_ssize_t i
+
+    for i in range(n_steps):
+        x_tails = tails_min + i * step
+
+        # Invalid points are flagged rather than skipped, so that the loop body
+        # has a single data-dependent branch (the best-cost update).
+        # Degenerate cases where the denominator would vanish get a dummy one.
+        denominator = x_U_nat - x_tails
+        non_degenerate = fabs(denominator) >= 1e-8
+        if not non_degenerate:
+            denominator = 1.0
+
+        feed_mass_kg = product_mass_kg * (x_U_product - x_tails) / denominator
+        tails_mass_kg = feed_mass_kg - product_mass_kg
+        swu_required = (
+            product_mass_kg * V_product
+            + tails_mass_kg * _V_swu(x_tails)
+            - feed_mass_kg * V_nat
+        )
+        total_cost = feed_mass_kg * feed_unit_cost_USD + swu_required * price_SWU_per_SWU_USD
+
+        valid = (
+            non_degenerate
+            & (feed_mass_kg > 0)
+            & (swu_required > 0)
+            & isfinite(swu_required)
+            & isfinite(total_cost)
+        )
+        if valid & ((not found) | (total_cost < best_cost)):
+            found = True
+            best_cost = total_cost
+            x_tails_best = x_tails
+
+    return found, x_tails_best
@@ -0,0 +1,568 @@
+
+import math
+from functools import lru_cache
+
+import numpy as np
+
+from ._core import FASTMATH_INF_SAFE, _jit, _vectorize, njit, annual_energy_MWh_core, annual_fresh_fuel_mass_kg_core
+from .simple_conversion_functions import UO2_to_U
+
+try:
+    from ._tails_kernel import search_tails as _search_tails_compiled
+except ImportError:  # The Cython build is optional (see setup.py)
+    _search_tails_compiled = None
+
+
+### Energy production ###
+@lru_cache(maxsize=32)
+def annual_energy_MWh(params) -> float:
+    """
+    Net annual electricity production in MWh.
+
+    `params` must be hashable (e.g. a frozen ProjectParameters) and provide
+    the attributes:
+    - n_reactors
+    - power_electric_per_reactor_MWe
+    - net_capacity_factor
+    """
+    return annual_energy_MWh_core(
+        params.n_reactors, params.power_electric_per_reactor_MWe, params.net_capacity_factor
+    )
+
+### Fuel in reactors ###
+def fuel_mass_per_reactorkg(project) -> float:
+    """Fuel mass in core (kgU)."""
+    return project.assemblies_per_core * project.fuel_mass_per_assembly_kg
+
+
+def fresh_fuel_mass_per_cycle_per_reactor_kg(project) -> float:
+    """Fresh fuel mass loaded per cycle (kgU)."""
+    return fuel_mass_per_reactorkg(project) * project.batch_fraction
+
+
+@lru_cache(maxsize=32)
+def annual_fresh_fuel_mass_kg(project) -> float:
+    """Annual fresh fuel mass (kgU/year)."""
+    return annual_fresh_fuel_mass_kg_core(
+        project.assemblies_per_core,
+        project.fuel_mass_per_assembly_kg,
+        project.batch_fraction,
+        project.n_reactors,
+        project.cycle_length_years,
+    )
+
+
+@lru_cache(maxsize=32)
+def annual_enriched_U_mass_kg(project) -> float:
+    """Annual Enriched Uranium mass (kgU/year)."""
+    return UO2_to_U(annual_fresh_fuel_mass_kg(project))
+
+
+### Front-end uranium and enrichment optimization ###
+
+@_vectorize(fastmath=FASTMATH_INF_SAFE)
+def _V_swu(x):
+    """
+    Value function used in SWU calculations.
+
+    Same mathematical form as in the main script:
+        V(x) = (1 - 2x) * ln((1 - x) / x)
+
+    The logarithm is evaluated as log1p(-x) - log(x), which avoids the
+    division and is more accurate for small assays. A ufunc: accepts scalars
+    (including from the Numba-compiled grid search) and arrays.
+    """
+    return (1.0 - 2.0 * x) * (np.log1p(-x) - np.log(x))
+
+
+@_jit(fastmath=FASTMATH_INF_SAFE)
+def _search_tails(
+    product_mass_kg: float,
+    x_U_nat: float,
+    x_U_product: float,
+    feed_unit_cost_USD: float,
+    price_SWU_per_SWU_USD: float,
+    tails_min: float,
+    tails_max: float,
+    n_steps: int,
+) -> tuple:
+    """
+    Grid search of the tails assay minimizing the front-end cost, over
+    n_steps points from tails_min (included) to tails_max (excluded).
+
+    `feed_unit_cost_USD` gathers every cost proportional to the feed mass
+    ($/kgU: natural uranium, conversion and transports). Returns
+    (found, x_tails_best) so that the loop can be compiled by Numba.
+
+    Points with a non-finite SWU or cost (assays outside of the domain of the
+    value function) are not valid; the kernel is compiled without the
+    fast-math flags that would assume inf and NaN never occur.
+    """
+    V_product = _V_swu(x_U_product)
+    V_nat = _V_swu(x_U_nat)
+
+    found = False
+    best_cost = 0.0
+    x_tails_best = tails_min
+
+    step = (tails_max - tails_min) / n_steps
+    for i in range(n_steps):
+        x_tails = tails_min + i * step
+
+        # Invalid points are flagged rather than skipped, so that the loop body
+        # has a single data-dependent branch (the best-cost update).
+        # Degenerate cases where the denominator would vanish get a dummy one.
+        denominator = x_U_nat - x_tails
+        non_degenerate = abs(denominator) >= 1e-8
+        denominator = denominator if non_degenerate else 1.0
+
+        feed_mass_kg = product_mass_kg * (x_U_product - x_tails) / denominator
+        tails_mass_kg = feed_mass_kg - product_mass_kg
+        swu_required = (
+            product_mass_kg * V_product
+            + tails_mass_kg * _V_swu(x_tails)
+            - feed_mass_kg * V_nat
+        )
+        total_cost = feed_mass_kg * feed_unit_cost_USD + swu_required * price_SWU_per_SWU_USD
+
+        valid = (
+            non_degenerate
+            & (feed_mass_kg > 0)
+            & (swu_required > 0)
+            & math.isfinite(swu_required)
+            & math.isfinite(total_cost)
+        )
+        if valid & ((not found) | (total_cost < best_cost)):
+            found = True
+            best_cost = total_cost
+            x_tails_best = x_tails
+
+    return found, x_tails_best
+
+
+def _search_tails_vectorized(
+    product_mass_kg: float,
+    x_U_nat: float,
+    x_U_product: float,
+    feed_unit_cost_USD: float,
+    price_SWU_per_SWU_USD: float,
+    tails_min: float,
+    tails_max: float,
+    n_steps: int,
+) -> tuple:
+    """Same as _search_tails, evaluated for all candidates at once with NumPy."""
+    step = (tails_max - tails_min) / n_steps
+    x_tails = tails_min + step * np.arange(n_steps)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        feed_mass_kg = product_mass_kg * (x_U_product - x_tails) / (x_U_nat - x_tails)
+        tails_mass_kg = feed_mass_kg - product_mass_kg
+        swu_required = (
+            product_mass_kg * _V_swu(x_U_product)
+            + tails_mass_kg * _V_swu(x_tails)
+            - feed_mass_kg * _V_swu(x_U_nat)
+        )
+    total = feed_mass_kg * feed_unit_cost_USD + swu_required * price_SWU_per_SWU_USD
+
+    invalid = (
+        (np.abs(x_U_nat - x_tails) < 1e-8)
+        | ~(feed_mass_kg > 0)
+        | ~(swu_required > 0)
+        | ~np.isfinite(total)
+    )
+    total = np.where(invalid, np.inf, total)
+
+    best = np.argmin(total)
+    if total[best] == np.inf:
+        return False, tails_min
+    return True, float(x_tails[best])
+
+
+# Grid search used by _optimize_tails: the Cython kernel if it was built, else
+# the Numba-compiled loop if Numba is installed, else the NumPy version
+if _search_tails_compiled is not None:
+    _grid_search = _search_tails_compiled
+elif njit is not None:
+    _grid_search = _search_tails
+else:
+    _grid_search = _search_tails_vectorized
+
+
+@_jit(fastmath=FASTMATH_INF_SAFE)
+def _tails_total_cost(
+    x_tails: float,
+    product_mass_kg: float,
+    x_U_nat: float,
+    x_U_product: float,
+    feed_unit_cost_USD: float,
+    price_SWU_per_SWU_USD: float,
+) -> float:
+    """Front-end cost for a given tails assay (inf if not feasible)."""
+    if abs(x_U_nat - x_tails) < 1e-8 or not 0.0 < x_tails < 1.0:
+        return math.inf
+    feed_mass_kg = product_mass_kg * (x_U_product - x_tails) / (x_U_nat - x_tails)
+    if feed_mass_kg <= 0:
+        return math.inf
+    swu_required = (
+        product_mass_kg * _V_swu(x_U_product)
+        + (feed_mass_kg - product_mass_kg) * _V_swu(x_tails)
+        - feed_mass_kg * _V_swu(x_U_nat)
+    )
+    if swu_required <= 0:
+        return math.inf
+    return feed_mass_kg * feed_unit_cost_USD + swu_required * price_SWU_per_SWU_USD
+
+
+def _optimize_tails(
+    product_mass_kg: float,
+    x_U_nat: float,
+    x_U_product: float,
+    feed_unit_cost_USD: float,
+    price_SWU_per_SWU_USD: float,
+    tails_min: float,
+    n_steps: int,
+) -> tuple:
+    """
+    Tails assay minimizing the front-end cost, on plain floats only.
+
+    The cost is smooth and unimodal, so a coarse pass over the whole range
+    [tails_min, x_U_nat) followed by a fine pass around the coarse optimum
+    reaches the resolution of a much denser uniform grid with far fewer
+    evaluations; the best grid point is then refined below the grid
+    resolution. Returns (found, x_tails_best).
+    """
+    n_coarse = max(n_steps // 2, 2)
+    found, x_tails_coarse = _grid_search(
+        product_mass_kg,
+        x_U_nat,
+        x_U_product,
+        feed_unit_cost_USD,
+        price_SWU_per_SWU_USD,
+        tails_min,
+        x_U_nat,
+        n_coarse,
+    )
+    if not found:
+        return False, tails_min
+
+    coarse_step = (x_U_nat - tails_min) / n_coarse
+    refined_min = max(tails_min, x_tails_coarse - coarse_step)
+    refined_max = min(x_U_nat, x_tails_coarse + coarse_step)
+    n_fine = max(n_steps - n_coarse, 2)
+    found, x_tails_fine = _grid_search(
+        product_mass_kg,
+        x_U_nat,
+        x_U_product,
+        feed_unit_cost_USD,
+        price_SWU_per_SWU_USD,
+        refined_min,
+        refined_max,
+        n_fine,
+    )
+    args = (product_mass_kg, x_U_nat, x_U_product, feed_unit_cost_USD, price_SWU_per_SWU_USD)
+
+    # Keep the best point over both passes
+    x_tails_best, grid_step = x_tails_coarse, coarse_step
+    cost_best = _tails_total_cost(x_tails_coarse, *args)
+    if found:
+        cost_fine = _tails_total_cost(x_tails_fine, *args)
+        if cost_fine < cost_best:
+            x_tails_best, grid_step, cost_best = x_tails_fine, (refined_max - refined_min) / n_fine, cost_fine
+
+    # Sub-grid refinement: vertex of the parabola through the best grid
+    # point and its two neighbours
+    cost_left = _tails_total_cost(x_tails_best - grid_step, *args)
+    cost_right = _tails_total_cost(x_tails_best + grid_step, *args)
+    curvature = cost_left - 2.0 * cost_best + cost_right
+    if math.isfinite(curvature) and curvature > 0:
+        x_tails_vertex = x_tails_best + grid_step * (cost_left - cost_right) / (2.0 * curvature)
+        if _tails_total_cost(x_tails_vertex, *args) < cost_best:
+            x_tails_best = x_tails_vertex
+    return True, x_tails_best
+
+
+# Compiled as a whole only when it calls the Numba grid search (Numba cannot
+# call into the Cython kernel). Infeasible points have an inf cost, hence the
+# restricted fast-math flags.
+if _grid_search is _search_tails:
+    _optimize_tails = _jit(_optimize_tails, fastmath=FASTMATH_INF_SAFE)
+
+
+@lru_cache(maxsize=128)
+def optimize_front_end_uranium_cost(
+    product_mass_kg: float,
+    x_U_nat: float,
+    x_U_product: float,
+    price_U_nat_per_kg_USD: float,
+    conversion_per_kgU_USD: float,
+    price_SWU_per_SWU_USD: float,
+    transport_U_nat_per_kg_per_km_USD: float = 0.0,
+    distance_U_nat_transport_km: float = 0.0,
+    transport_U_converted_per_kgU_per_km_USD: float = 0.0,
+    distance_U_converted_transport_km: float = 0.0,
+    tails_min: float = 0.0005,
+    n_steps: int = 100,
+    ) -> dict:
+    """
+    Optimize the front-end fuel cycle cost (natural U + natural U transport + conversion + converted U transport + enrichment)
+    for a given required product mass.
+
+    Results are memoized on the (scalar) arguments: the returned dict is
+    shared between identical calls and must not be modified.
+
+    Arguments
+    ---------
+    product_mass_kg : float
+        Required mass of enriched uranium product (kgU).
+    x_U_nat : float
+        U-235 fraction in natural uranium (feed).
+    x_U_product : float
+        U-235 fraction in enriched product.
+    price_U_nat_per_kg_USD : float
+        Price of natural uranium ($/kgU).
+    conversion_per_kgU_USD : float
+        Conversion cost ($/kgU of feed).
+    price_SWU_per_SWU_USD : float
+        Enrichment cost ($/SWU).
+    transport_U_nat_per_kg_per_km_USD : float
+        Transport cost per kgU per km for natural uranium ($/kgU/km).
+    distance_U_nat_transport_km : float
+        Transport distance for natural uranium (km).
+    transport_U_converted_per_kgU_per_km_USD : float
+        Transport cost per kgU per km for converted uranium ($/kgU/km).
+    distance_U_converted_transport_km : float
+        Transport distance for converted uranium (km).
+    tails_min : float
+        Minimum tails assay to search (U-235 fraction in tails).
+    n_steps : int
+        Number of tails assay evaluations of the grid search, split evenly
+        between a coarse pass over the whole range and a fine pass around the
+        coarse optimum (which is then refined below the grid resolution).
+
+    Returns
+    -------
+    dict with keys:
+        - "M_U_nat_kg"          : optimal natural uranium mass (kg)
+        - "x_tails_opt"         : optimal tails U-235 fraction
+        - "cost_U_nat_USD"      : cost of natural uranium ($)
+        - "cost_transport_U_nat_USD" : cost of natural uranium transport ($)
+        - "cost_conversion_USD" : cost of conversion ($)
+        - "cost_transport_U_converted_USD" : cost of converted uranium transport ($)
+        - "cost_enrichment_USD" : cost of enrichment ($)
+    """
+    if product_mass_kg <= 0:
+        raise ValueError(
+            "Product mass must be strictly positive in optimize_front_end_uranium_cost()."
+        )
+    if not 0.0 < x_U_nat < x_U_product < 1.0:
+        raise ValueError(
+            "U-235 fractions must satisfy 0 < x_U_nat < x_U_product < 1 in optimize_front_end_uranium_cost()."
+        )
+
+    def front_end_costs(x_tails: float):
+        """Feed mass and cost components for a given tails assay (None if not feasible)."""
+        # Avoid degenerate cases where denominator would vanish, and assays
+        # outside of the domain of the value function
+        if abs(x_U_nat - x_tails) < 1e-8 or not 0.0 < x_tails < 1.0:
+            return None
+
+        # Mass balance to compute feed (natural uranium) from product and tails assay
+        feed_mass_kg = product_mass_kg * (x_U_product - x_tails) / (x_U_nat - x_tails)  # feed mass (kgU nat)
+        if feed_mass_kg <= 0:
+            return None
+
+        tails_mass_kg = feed_mass_kg - product_mass_kg  # tails mass
+
+        # SWU requirement
+        swu_required = float(
+            product_mass_kg * _V_swu(x_U_product)
+            + tails_mass_kg * _V_swu(x_tails)
+            - feed_mass_kg * _V_swu(x_U_nat)
+        )
+        if not math.isfinite(swu_required) or swu_required <= 0:
+            return None
+
+        # Cost components
+        cost_U_nat = feed_mass_kg * price_U_nat_per_kg_USD
+        cost_transport_U_nat = feed_mass_kg * transport_U_nat_per_kg_per_km_USD * distance_U_nat_transport_km
+        cost_conversion = feed_mass_kg * conversion_per_kgU_USD
+        # Converted uranium transport (after conversion, same mass as feed since conversion doesn't change mass)
+        cost_transport_U_converted = feed_mass_kg * transport_U_converted_per_kgU_per_km_USD * distance_U_converted_transport_km
+        cost_enrichment = swu_required * price_SWU_per_SWU_USD
+        if not math.isfinite(
+            cost_U_nat + cost_transport_U_nat + cost_conversion + cost_transport_U_converted + cost_enrichment
+        ):
+            return None
+
+        return {
+            "M_U_nat_kg": feed_mass_kg,
+            "x_tails_opt": x_tails,
+            "cost_U_nat_USD": cost_U_nat,
+            "cost_transport_U_nat_USD": cost_transport_U_nat,
+            "cost_conversion_USD": cost_conversion,
+            "cost_transport_U_converted_USD": cost_transport_U_converted,
+            "cost_enrichment_USD": cost_enrichment,
+        }
+
+    feed_unit_cost_USD = (
+        price_U_nat_per_kg_USD
+        + transport_U_nat_per_kg_per_km_USD * distance_U_nat_transport_km
+        + conversion_per_kgU_USD
+        + transport_U_converted_per_kgU_per_km_USD * distance_U_converted_transport_km
+    )
+    found, x_tails_best = _optimize_tails(
+        product_mass_kg,
+        x_U_nat,
+        x_U_product,
+        feed_unit_cost_USD,
+        price_SWU_per_SWU_USD,
+        tails_min,
+        n_steps,
+    )
+    best_results = front_end_costs(float(x_tails_best)) if found else None
+
+    # In case no valid point was found (should be rare), explicitly raise an error
+    if best_results is None:
+        raise ValueError(
+            "No valid combination of tails assay and feed mass was found "
+            "for the given inputs in optimize_front_end_uranium_cost()."
+        )
+
+    return best_results
+
+
+def optimize_front_end_uranium_cost_batch(
+    product_mass_kg,
+    x_U_nat,
+    x_U_product,
+    price_U_nat_per_kg_USD,
+    conversion_per_kgU_USD,
+    price_SWU_per_SWU_USD,
+    transport_U_nat_per_kg_per_km_USD=0.0,
+    distance_U_nat_transport_km=0.0,
+    transport_U_converted_per_kgU_per_km_USD=0.0,
+    distance_U_converted_transport_km=0.0,
+    tails_min: float = 0.0005,
+    n_steps: int = 100,
+    ) -> dict:
+    """
+    Batched version of optimize_front_end_uranium_cost for N scenarios at once.
+
+    Every argument except `tails_min` and `n_steps` can be a scalar or a 1-D
+    array of length N. Each pass of the tails assay grid is evaluated for all
+    scenarios as a single 2-D array and each scenario picks and refines its own
+    optimum, so the results match optimize_front_end_uranium_cost.
+
+    Returns the same keys as optimize_front_end_uranium_cost, each mapped to
+    an array of length N.
+    """
+    (
+        product_mass_kg,
+        x_U_nat,
+        x_U_product,
+        price_U_nat_per_kg_USD,
+        conversion_per_kgU_USD,
+        price_SWU_per_SWU_USD,
+        transport_U_nat_per_kg_per_km_USD,
+        distance_U_nat_transport_km,
+        transport_U_converted_per_kgU_per_km_USD,
+        distance_U_converted_transport_km,
+    ) = np.broadcast_arrays(*(
+        np.atleast_1d(np.asarray(value, dtype=float))
+        for value in (
+            product_mass_kg,
+            x_U_nat,
+            x_U_product,
+            price_U_nat_per_kg_USD,
+            conversion_per_kgU_USD,
+            price_SWU_per_SWU_USD,
+            transport_U_nat_per_kg_per_km_USD,
+            distance_U_nat_transport_km,
+            transport_U_converted_per_kgU_per_km_USD,
+            distance_U_converted_transport_km,
+        )
+    ))
+    if np.any(product_mass_kg <= 0):
+        raise ValueError(
+            "Product mass must be strictly positive in optimize_front_end_uranium_cost_batch()."
+        )
+    if not np.all((0.0 < x_U_nat) & (x_U_nat < x_U_product) & (x_U_product < 1.0)):
+        raise ValueError(
+            "U-235 fractions must satisfy 0 < x_U_nat < x_U_product < 1 in optimize_front_end_uranium_cost_batch()."
+        )
+
+    feed_unit_cost_USD = (
+        price_U_nat_per_kg_USD
+        + transport_U_nat_per_kg_per_km_USD * distance_U_nat_transport_km
+        + conversion_per_kgU_USD
+        + transport_U_converted_per_kgU_per_km_USD * distance_U_converted_transport_km
+    )
+
+    # Scenarios along axis 0, tails assay candidates along axis 1
+    product = product_mass_kg[:, None]
+    x_nat = x_U_nat[:, None]
+    x_product = x_U_product[:, None]
+    rows = np.arange(product_mass_kg.size)
+
+    def evaluate(x_tails):
+        """Feed mass, SWU and total cost (inf if not feasible) of (N, k) tails assays."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            feed_mass_kg = product * (x_product - x_tails) / (x_nat - x_tails)
+            swu_required = (
+                product * _V_swu(x_product) + (feed_mass_kg - product) * _V_swu(x_tails) - feed_mass_kg * _V_swu(x_nat)
+            )
+        total = feed_mass_kg * feed_unit_cost_USD[:, None] + swu_required * price_SWU_per_SWU_USD[:, None]
+        invalid = (np.abs(x_nat - x_tails) < 1e-8) | ~(feed_mass_kg > 0) | ~(swu_required > 0)
+        return feed_mass_kg, swu_required, np.where(invalid, np.inf, total)
+
+    def search_tails(lower, upper, n_points):
+        """Best grid point of every scenario between lower (included) and upper (excluded)."""
+        step = (upper - lower)[:, None] / n_points
+        x_tails = lower[:, None] + step * np.arange(n_points)
+        feed_mass_kg, swu_required, total = evaluate(x_tails)
+        best = np.argmin(total, axis=1)
+        return x_tails[rows, best], feed_mass_kg[rows, best], swu_required[rows, best], total[rows, best]
+
+    # Coarse pass over the whole range, then fine pass around each coarse optimum
+    # (same two-pass grid as optimize_front_end_uranium_cost)
+    n_coarse = max(n_steps // 2, 2)
+    coarse = search_tails(np.full_like(x_U_nat, tails_min), x_U_nat, n_coarse)
+    if np.any(coarse[3] == np.inf):
+        raise ValueError(
+            "No valid combination of tails assay and feed mass was found "
+            "for some of the inputs in optimize_front_end_uranium_cost_batch()."
+        )
+    coarse_step = (x_U_nat - tails_min) / n_coarse
+    refined_min = np.maximum(tails_min, coarse[0] - coarse_step)
+    refined_max = np.minimum(x_U_nat, coarse[0] + coarse_step)
+    n_fine = max(n_steps - n_coarse, 2)
+    fine = search_tails(refined_min, refined_max, n_fine)
+    use_fine = fine[3] < coarse[3]
+    x_tails_best, feed_best, swu_best, cost_best = (np.where(use_fine, f, c) for f, c in zip(fine, coarse))
+
+    # Sub-grid refinement: vertex of the parabola through the best grid point
+    # and its two neighbours
+    grid_step = np.where(use_fine, (refined_max - refined_min) / n_fine, coarse_step)
+    _, _, neighbour_costs = evaluate(x_tails_best[:, None] + grid_step[:, None] * np.array([-1.0, 1.0]))
+    cost_left, cost_right = neighbour_costs.T
+    curvature = cost_left - 2.0 * cost_best + cost_right
+    convex = np.isfinite(curvature) & (curvature > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_tails_vertex = np.where(
+            convex, x_tails_best + grid_step * (cost_left - cost_right) / (2.0 * curvature), x_tails_best
+        )
+    feed_vertex, swu_vertex, cost_vertex = (values[:, 0] for values in evaluate(x_tails_vertex[:, None]))
+    use_vertex = cost_vertex < cost_best
+    x_tails_best = np.where(use_vertex, x_tails_vertex, x_tails_best)
+    feed_best = np.where(use_vertex, feed_vertex, feed_best)
+    swu_best = np.where(use_vertex, swu_vertex, swu_best)
+
+    return {
+        "M_U_nat_kg": feed_best,
+        "x_tails_opt": x_tails_best,
+        "cost_U_nat_USD": feed_best * price_U_nat_per_kg_USD,
+        "cost_transport_U_nat_USD": feed_best * transport_U_nat_per_kg_per_km_USD * distance_U_nat_transport_km,
+        "cost_conversion_USD": feed_best * conversion_per_kgU_USD,
+        "cost_transport_U_converted_USD": feed_best * transport_U_converted_per_kgU_per_km_USD * distance_U_converted_transport_km,
+        "cost_enrichment_USD": swu_best * price_SWU_per_SWU_USD,
+    }
@@ -0,0 +1,31 @@
+### Simple conversion functions such as going from an oxide mass to a uranium mass ###
+
+U_MOLAR_MASS = 0.238  # kg/mol
+O_MOLAR_MASS = 0.016  # kg/mol
+
+# The mass of one mole of U3O8 is equal to the mass of 3 moles of U and 8 moles of O.
+U3O8_MOLAR_MASS = 3 * U_MOLAR_MASS + 8 * O_MOLAR_MASS
+# The mass of one mole of UO2 is equal to the mass of 1 mole of U and 2 moles of O.
+UO2_MOLAR_MASS = U_MOLAR_MASS + 2 * O_MOLAR_MASS
+
+# Mass fractions of uranium in the oxides (computed once at import)
+_U3O8_U_FRACTION = (3 * U_MOLAR_MASS) / U3O8_MOLAR_MASS
+_UO2_U_FRACTION = U_MOLAR_MASS / UO2_MOLAR_MASS
+
+
+def U3O8_to_U(U3O8_mass):
+    """
+    Convert a U3O8 mass to a uranium mass.
+
+    The mass of one mole of U3O8 is equal to the mass of 3 moles of U and 8 moles of O.
+    """
+    return U3O8_mass * _U3O8_U_FRACTION
+
+
+def UO2_to_U(UO2_mass):
+    """
+    Convert a UO2 mass to a uranium mass.
+
+    The mass of one mole of UO2 is equal to the mass of 1 mole of U and 2 moles of O.
+    """
+    return UO2_mass * _UO2_U_FRACTION
@@ -0,0 +1,32 @@
+"""
+Optional build of the compiled (Cython) kernels of the LCOE model.
+
+The app runs without it; to build the extension in place, run:
+
+    pip install cython
+    python setup.py build_ext --inplace
+
+Without Cython installed, the package is set up without the extension.
+"""
+
+from setuptools import Extension, setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:  # Cython is optional: the Numba or NumPy grid search is used instead
+    cythonize = None
+
+extensions = [
+    Extension(
+        "annex_functions._tails_kernel",
+        ["annex_functions/_tails_kernel.pyx"],
+        # Portable build with strict IEEE arithmetic, so that the grid search
+        # matches the NumPy version of the kernel
+        extra_compile_args=["-O3"],
+    ),
+]
+
+setup(
+    name="nuclear-lcoe-app",
+    ext_modules=cythonize(extensions, language_level=3) if cythonize is not None else [],
+)
@@ -0,0 +1,69 @@
+"""
+Out-of-domain enrichment inputs must fail loudly on every backend.
+
+Each case runs in a fresh interpreter so that the Numba and Numba-disabled
+paths are both exercised regardless of what is installed (the optional Cython
+kernel is blocked so that the Numba loop is the one under test).
+"""
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+SCRIPT = textwrap.dedent(
+    """
+    import sys
+    import warnings
+
+    sys.modules["annex_functions._tails_kernel"] = None
+    if {disable_numba}:
+        sys.modules["numba"] = None
+
+    import numpy as np
+
+    from annex_functions import annex_cost_functions as acf
+
+    warnings.simplefilter("ignore", RuntimeWarning)
+
+    for x_U_nat, x_U_product in [(0.00711, 1.0), (0.00711, 0.00711), (0.00711, 0.005)]:
+        try:
+            acf.optimize_front_end_uranium_cost(
+                1000.0, x_U_nat, x_U_product, 100.0, 10.0, 120.0
+            )
+        except ValueError:
+            pass
+        else:
+            raise SystemExit(f"no ValueError for x_U_nat={{x_U_nat}}, x_U_product={{x_U_product}}")
+
+    # The compiled SWU value function must give the same inf and NaN as NumPy
+    # outside of the (0, 1) domain.
+    x = np.array([0.0, 1.0, 1.5, 0.00711])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        expected = (1.0 - 2.0 * x) * (np.log1p(-x) - np.log(x))
+        np.testing.assert_allclose(acf._V_swu(x), expected, rtol=1e-12)
+
+    # The compiled grid search must agree with the pure-Python one even when
+    # every candidate is infeasible (infinite SWU for a pure U-235 product).
+    args = (1000.0, 0.00711, 1.0, 110.0, 120.0, 0.0005, 0.00711, 50)
+    expected = acf._search_tails_vectorized(*args)
+    py_func = getattr(acf._search_tails, "py_func", acf._search_tails)
+    for result in (acf._grid_search(*args), acf._search_tails(*args), py_func(*args)):
+        if tuple(result) != tuple(expected) or result[0]:
+            raise SystemExit(f"grid search mismatch: {{result}} != {{expected}}")
+    """
+)
+
+
+@pytest.mark.parametrize("disable_numba", [False, True], ids=["numba", "no-numba"])
+def test_rejects_out_of_domain_enrichment(disable_numba):
+    completed = subprocess.run(
+        [sys.executable, "-c", SCRIPT.format(disable_numba=disable_numba)],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    assert completed.returncode == 0, completed.stdout + completed.stderr